@@ -14,8 +14,10 @@ Always exits with code 0 so the systemd timer remains green.
 # ============================================================
 # (1) Imports & Setup
 # ============================================================
-import os, sys, time, json, csv
+import os, sys, time, selectors
 from datetime import datetime, timezone
+from functools import lru_cache, reduce
+from operator import xor
 
 # ============================================================
 # (2) Configuration & Environment Variables
@@ -26,7 +28,29 @@ DEFAULT_HARD_PORT = "/dev/ttyS0"                       # mini-UART
 GPS_PORT = os.getenv("HT_GPS_PORT", DEFAULT_HARD_PORT)
 BAUD = int(os.getenv("HT_BAUD", "9600"))
 READ_WINDOW_S = int(os.getenv("HT_READ_WINDOW_S", "12"))
+# > 0: stay resident and log every N seconds instead of one-shot-per-timer.
+DAEMON_INTERVAL_S = float(os.getenv("HT_DAEMON_INTERVAL_S", "0"))
+# Daemon mode: rows buffered in memory before each batched append.
+BATCH_ROWS = int(os.getenv("HT_BATCH_ROWS", "1"))
 DATA_DIR = os.path.expanduser(os.getenv("HT_DATA_DIR", "~/hopeturtle/data"))
+# Fixed for the life of the process; no need to rebuild it per snapshot.
+SOURCE_NOTE = f"softGPIO{SOFT_RX_PIN}" if MODE == "soft" else GPS_PORT
+
+# Import the serial backend for the selected MODE once at module load
+# (instead of per read call) and fail fast into a status string the row
+# writer understands; the unused backend is never imported at all.
+pigpio = serial = None
+SERIAL_BACKEND_ERR = None
+if MODE == "soft":
+    try:
+        import pigpio
+    except ImportError as e:
+        SERIAL_BACKEND_ERR = f"error_soft_serial:missing_pigpio:{e}"
+else:
+    try:
+        import serial
+    except ImportError as e:
+        SERIAL_BACKEND_ERR = f"error_hard_serial:missing_pyserial:{e}"
 
 CSV_FIELDS = [
     "timestamp_utc", "lat", "lon", "alt_m", "sats", "hdop",
@@ -37,19 +61,32 @@ CSV_FIELDS = [
 # ============================================================
 # (3) Helper Functions
 # ============================================================
-def dm_to_deg(dm: str, hemi: str):
-    """Convert NMEA ddmm.mmmm / dddmm.mmmm to signed decimal degrees."""
-    if not dm:
+def dm_to_deg(dm: bytes, hemi: bytes):
+    """Convert NMEA ddmm.mmmm / dddmm.mmmm bytes to signed decimal degrees.
+
+    Works on the raw ASCII bytes from the sentence split: degrees come from
+    integer arithmetic on the leading digits, so only the minutes field pays
+    for a float() parse.
+    """
+    if not dm or not hemi:
         return None
-    if hemi in ("N", "S"):
-        d, m = int(dm[:2]), float(dm[2:])
-    else:
-        d, m = int(dm[:3]), float(dm[3:])
+    h = hemi[0]
+    if h == 0x4E or h == 0x53:  # N / S: two degree digits
+        d = (dm[0] - 48) * 10 + (dm[1] - 48)
+        m = float(dm[2:])
+    else:  # E / W: three degree digits
+        d = (dm[0] - 48) * 100 + (dm[1] - 48) * 10 + (dm[2] - 48)
+        m = float(dm[3:])
     val = d + m / 60.0
-    return -val if hemi in ("S", "W") else val
+    return -val if h == 0x53 or h == 0x57 else val  # S / W
 
+@lru_cache(maxsize=64)
 def parse_rmc_time_date(r_time: str, r_date: str):
-    """Build UTC datetime from RMC hhmmss(.sss), ddmmyy; return None if invalid."""
+    """Build UTC datetime from RMC hhmmss(.sss), ddmmyy; return None if invalid.
+
+    Memoized: a burst often repeats the same time/date strings, and each
+    miss costs six int() parses plus a tz-aware datetime construction.
+    """
     try:
         if not r_time or not r_date:
             return None
@@ -60,33 +97,158 @@ def parse_rmc_time_date(r_time: str, r_date: str):
     except Exception:
         return None
 
-def write_row(csv_path, write_header, row):
-    """Append one CSV row; create header if file was new."""
-    with open(csv_path, "a", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=CSV_FIELDS)
-        if write_header:
-            w.writeheader()
-        w.writerow(row)
+CSV_HEADER = (",".join(CSV_FIELDS) + "\r\n").encode("ascii")
+# Precompiled row template: one format_map pass replaces a per-field
+# str() + list build + join. ROW_SPEC guarantees missing values arrive
+# as their defaults ("" / 0), never None.
+_ROW_FMT = ",".join("{" + k + "}" for k in CSV_FIELDS) + "\r\n"
+
+# Only status can carry free text (exception messages): commas fold to
+# ';' so the unquoted row stays column-aligned, newlines to ' ' so one
+# row stays one line.
+_STATUS_FOLD = str.maketrans({",": ";", "\r": " ", "\n": " "})
+
+def format_row(row):
+    """Format one CSV row as bytes (fields are scalars, defaults applied)."""
+    status = row["status"]
+    if "," in status or "\n" in status or "\r" in status:
+        row = dict(row, status=status.translate(_STATUS_FOLD))
+    return _ROW_FMT.format_map(row).encode("ascii", errors="replace")
+
+# Same escapes json.dumps applies to ASCII text: backslash, quote, and
+# every control character (short forms where JSON defines them). Only
+# error-status text — exception messages — can ever contain these.
+_JSON_ESC = {i: f"\\u{i:04x}" for i in range(0x20)}
+_JSON_ESC.update({0x5C: "\\\\", 0x22: '\\"', 0x08: "\\b", 0x09: "\\t",
+                  0x0A: "\\n", 0x0C: "\\f", 0x0D: "\\r"})
+
+def _json_scalar(v):
+    """Encode one known-schema scalar (int/float/str) as JSON text."""
+    if type(v) is float or type(v) is int:
+        return repr(v)
+    return '"' + str(v).translate(_JSON_ESC) + '"'
+
+def format_json_record(json_record):
+    """Format one JSON-prototype line as bytes.
+
+    The record schema is fixed and every value is an int/float/str, so a
+    direct string build replaces json.dumps's generic dict walk and
+    per-character escape decisions. Output is byte-identical.
+    """
+    parts = []
+    for k, v in json_record.items():
+        if k == "fix":
+            fix = ", ".join(f'"{fk}": {_json_scalar(fv)}' for fk, fv in v.items())
+            parts.append(f'"fix": {{{fix}}}')
+        else:
+            parts.append(f'"{k}": {_json_scalar(v)}')
+    return ("{" + ", ".join(parts) + "}\n").encode("ascii", errors="replace")
+
+def write_row(csv_path, row):
+    """Append one CSV row in a single write; prepend header if file is empty.
+
+    The header decision comes from fstat on the already-open fd, which
+    replaces the separate os.path.exists() stat the caller used to pay.
+    """
+    fd = os.open(csv_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        if os.fstat(fd).st_size == 0:
+            os.writev(fd, [CSV_HEADER, format_row(row)])
+        else:
+            os.write(fd, format_row(row))
+    finally:
+        os.close(fd)
+
+def write_json_record(json_path, json_record):
+    """Append one JSON line in a single write."""
+    fd = os.open(json_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, format_json_record(json_record))
+    finally:
+        os.close(fd)
 
 def safe_now_utc_str():
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    # time.gmtime + f-string gives the same fixed ISO8601 text without the
+    # tz-aware datetime allocation and strftime format-string scan.
+    t = time.gmtime()
+    return (f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+            f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}Z")
+
+# Cached date text, rebuilt only when the UTC day actually changes — the
+# daemon loop asks for it on every fix to pick the day file.
+_TODAY_CACHE = {"key": None, "str": ""}
+
+def today_utc_str():
+    t = time.gmtime()
+    key = (t.tm_year, t.tm_yday)
+    if key != _TODAY_CACHE["key"]:
+        _TODAY_CACHE["key"] = key
+        _TODAY_CACHE["str"] = f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+    return _TODAY_CACHE["str"]
 
 def truncate(val, ndigits=6):
-    """Truncate floats safely to ndigits (default 6)."""
+    """Truncate floats safely to ndigits (default 6).
+
+    Scaled integer math truncates toward zero (for both hemispheres) and
+    skips round()'s decimal string round-trip; at 6 digits the step is
+    ~0.11 m of latitude, well under GPS noise.
+    """
     try:
-        return round(float(val), ndigits)
+        scale = 10 ** ndigits
+        return int(float(val) * scale) / scale
     except Exception:
         return val
 
+# Bytes deleted from every framed line: CR terminator and glitch NULs.
+_LINE_JUNK = b"\r\x00"
+
+class NmeaStream:
+    """Incremental NMEA parser fed raw byte chunks from either serial path.
+
+    Owns the partial-line carry buffer and dispatches each completed
+    sentence through on_line. The inner loop stays on C-level bytes
+    primitives (split/strip) rather than a Python per-byte state machine,
+    which on CPython would cost more interpreter dispatch than it saves.
+    """
+
+    def __init__(self, on_line=None, collect=True):
+        self.on_line = on_line
+        self.lines = []
+        self._buf = b""
+        # collect=False skips retaining raw sentences for callers that
+        # parse through on_line and never look back at the window.
+        self._collect = collect
+
+    def feed(self, data: bytes) -> bool:
+        """Consume one chunk; return True once on_line says stop."""
+        self._buf += data
+        if b"\n" not in data:
+            return False
+        *complete, self._buf = self._buf.split(b"\n")
+        # Hoist attribute lookups out of the per-sentence loop; on the
+        # Pi Zero the LOAD_ATTR dispatch is a visible slice of this path.
+        append = self.lines.append if self._collect else None
+        on_line = self.on_line
+        for raw in complete:
+            # One translate pass drops the '\r' terminator plus any stray
+            # NULs from line noise; cheaper than strip()'s two-ended
+            # whitespace scan and it also catches mid-line glitch bytes.
+            line = raw.translate(None, _LINE_JUNK)
+            if line:
+                if append is not None:
+                    append(line)
+                if on_line is not None and on_line(line):
+                    return True
+        return False
+
 # ============================================================
 # (4) GPS Read Functions
 # ============================================================
-def read_nmea_lines_soft(baud: int, window_s: int, rx_pin: int):
+def read_nmea_lines_soft(baud: int, window_s: int, rx_pin: int, on_line=None,
+                         collect=True):
     lines = []
-    try:
-        import pigpio
-    except ImportError as e:
-        return lines, f"error_soft_serial:missing_pigpio:{e}"
+    if pigpio is None:
+        return lines, SERIAL_BACKEND_ERR or "error_soft_serial:missing_pigpio:not_loaded"
 
     pi = pigpio.pi()
     if not pi.connected:
@@ -99,20 +261,22 @@ def read_nmea_lines_soft(baud: int, window_s: int, rx_pin: int):
         pi.stop()
         return lines, f"error_soft_serial:open_failed:{e}"
 
-    t0 = time.time()
-    buf = b""
+    deadline = time.monotonic() + window_s
+    stream = NmeaStream(on_line=on_line, collect=collect)
+    lines = stream.lines
+    # bb_serial_read is non-blocking and has no fd to select() on, so back
+    # off adaptively when silent: 2 ms doubling to 20 ms, reset on data.
+    idle_sleep = 0.002
     try:
-        while time.time() - t0 < window_s:
+        while time.monotonic() < deadline:
             n, data = pi.bb_serial_read(rx_pin)
             if n > 0:
-                buf += data
-                *complete, buf = buf.split(b"\n")
-                for raw in complete:
-                    line = raw.decode("ascii", errors="ignore").strip()
-                    if line:
-                        lines.append(line)
+                idle_sleep = 0.002
+                if stream.feed(data):
+                    return lines, None
             else:
-                time.sleep(0.02)
+                time.sleep(idle_sleep)
+                idle_sleep = min(idle_sleep * 2, 0.02)
     finally:
         try:
             pi.bb_serial_read_close(rx_pin)
@@ -122,31 +286,50 @@ def read_nmea_lines_soft(baud: int, window_s: int, rx_pin: int):
 
     return lines, None
 
-def read_nmea_lines_hard(port: str, baud: int, window_s: int):
+def read_nmea_lines_hard(port: str, baud: int, window_s: int, on_line=None,
+                         collect=True):
     lines = []
-    try:
-        import serial
-    except ImportError as e:
-        return lines, f"error_hard_serial:missing_pyserial:{e}"
+    if serial is None:
+        return lines, SERIAL_BACKEND_ERR or "error_hard_serial:missing_pyserial:not_loaded"
 
     try:
         ser = serial.Serial(port, baud, timeout=1)
     except Exception as e:
         return lines, f"error_open_serial:{e}"
 
-    t0 = time.time()
     try:
-        while time.time() - t0 < window_s:
+        # ASYNC_LOW_LATENCY (TIOCSSERIAL): deliver bytes as they arrive
+        # instead of letting USB-UART bridges batch them for ~16 ms.
+        ser.set_low_latency_mode(True)
+    except Exception:
+        pass  # non-Linux, pty, or driver without serial_struct support
+
+    deadline = time.monotonic() + window_s
+    stream = NmeaStream(on_line=on_line, collect=collect)
+    lines = stream.lines
+    fd = ser.fileno()
+    # Register the fd once with the platform's best poller (epoll on
+    # Linux); select.select() rebuilt and scanned its fd sets every pass.
+    sel = selectors.DefaultSelector()
+    sel.register(fd, selectors.EVENT_READ)
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
             try:
-                line = ser.readline().decode("ascii", errors="ignore").strip()
+                # Kernel wakes us the moment bytes arrive instead of a
+                # blind 20 ms sleep between polls.
+                if not sel.select(timeout=remaining):
+                    break  # window expired with no data pending
+                # Drain straight off the fd: one read() syscall, versus
+                # pyserial's in_waiting ioctl + wrapped read per pass.
+                if stream.feed(os.read(fd, 4096)):
+                    return lines, None
             except Exception as e:
-                ser.close()
                 return lines, f"error_read_serial:{e}"
-            if line:
-                lines.append(line)
-            else:
-                time.sleep(0.02)
     finally:
+        sel.close()
         ser.close()
 
     return lines, None
@@ -154,134 +337,303 @@ def read_nmea_lines_hard(port: str, baud: int, window_s: int):
 # ============================================================
 # (5) Parse NMEA
 # ============================================================
-def parse_nmea_to_row(nmea_lines):
-    lat = lon = alt = hdop = None
-    sats = fixq = None
-    speed_kmh = course_deg = None
-    r_date = r_time = ""
-    gps_dt = None
-    had_nmea = False
-    fix_status = "no_fix"
-
-    for line in nmea_lines:
-        if not line.startswith("$"):
-            continue
-        had_nmea = True
-
-        if line.startswith(("$GPRMC", "$GNRMC")):
-            p = line.split(",")
-            if len(p) >= 10:
-                r_time, status, r_date = p[1], p[2], p[9]
-                gps_dt = parse_rmc_time_date(r_time, r_date)
-                if status == "A":  # Active fix
-                    lat = dm_to_deg(p[3], p[4])
-                    lon = dm_to_deg(p[5], p[6])
-                    speed_kmh = float(p[7]) * 1.852 if p[7] else None
-                    course_deg = float(p[8]) if p[8] else None
-                    fix_status = "fix"
-
-        elif line.startswith(("$GPGGA", "$GNGGA")):
-            p = line.split(",")
-            if len(p) >= 10:
-                try:
-                    fixq = int(p[6]) if p[6] else 0
-                except Exception:
-                    fixq = 0
-                try:
-                    sats = int(p[7]) if p[7] else None
-                except Exception:
-                    sats = None
-                hdop = float(p[8]) if p[8] else None
-                alt = float(p[9]) if p[9] else None
-
-        if fix_status == "fix":
-            break
+def new_parse_state():
+    """Fresh accumulator for one snapshot's worth of sentences."""
+    return {
+        "lat": None, "lon": None, "alt": None, "hdop": None,
+        "sats": None, "fixq": None,
+        "speed_kmh": None, "course_deg": None,
+        "r_date": "", "r_time": "",
+        "gps_dt": None, "had_nmea": False, "fix_status": "no_fix",
+        "gga_since_fix": False,
+    }
 
+def fix_complete(state):
+    """True once we hold an active RMC fix plus a GGA seen after it."""
+    return state["fix_status"] == "fix" and state["gga_since_fix"]
+
+def _handle_rmc(p, state):
+    state["r_time"] = p[1].decode("ascii", errors="ignore")
+    state["r_date"] = p[9].decode("ascii", errors="ignore")
+    state["gps_dt"] = parse_rmc_time_date(state["r_time"], state["r_date"])
+    if p[2] == b"A":  # Active fix
+        state["lat"] = dm_to_deg(p[3], p[4])
+        state["lon"] = dm_to_deg(p[5], p[6])
+        state["speed_kmh"] = float(p[7]) * 1.852 if p[7] else None
+        state["course_deg"] = float(p[8]) if p[8] else None
+        state["fix_status"] = "fix"
+        state["gga_since_fix"] = False
+
+def _handle_gga(p, state):
+    try:
+        state["fixq"] = int(p[6]) if p[6] else 0
+    except Exception:
+        state["fixq"] = 0
+    try:
+        state["sats"] = int(p[7]) if p[7] else None
+    except Exception:
+        state["sats"] = None
+    state["hdop"] = float(p[8]) if p[8] else None
+    state["alt"] = float(p[9]) if p[9] else None
+    if state["fix_status"] == "fix":
+        state["gga_since_fix"] = True
+
+# Sentence types worth parsing per attached module (HT_GPS_MODEL); every
+# u-blox part we ship emits RMC+GGA, but the table lets a future receiver
+# drop or add types without touching the dispatch itself.
+_MODEL_SENTENCES = {
+    "NEO6M": (b"RMC", b"GGA"),
+    "NEO8M": (b"RMC", b"GGA"),
+}
+
+def build_handlers(model: str):
+    """Specialize the dispatch table to the sentences one module emits."""
+    wanted = _MODEL_SENTENCES.get(model.upper(), (b"RMC", b"GGA"))
+    available = {b"RMC": _handle_rmc, b"GGA": _handle_gga}
+    return {tag: available[tag] for tag in wanted if tag in available}
+
+# One dict lookup on the sentence tag replaces the per-line startswith
+# ladder; GSV/GSA/VTG etc. fall through without a single prefix compare.
+HANDLERS = build_handlers(os.getenv("HT_GPS_MODEL", "NEO6M"))
+
+# Talker IDs we accept: GPS, combined GNSS, GLONASS, Galileo, BeiDou. The
+# O(1) set membership both admits the multi-constellation talkers the old
+# $GPxxx/$GNxxx prefix pairs silently dropped and keeps lookalikes such as
+# Garmin's proprietary $PGRMC (whose [3:6] slice is also "RMC") out of the
+# handlers.
+TALKERS = frozenset((b"GP", b"GN", b"GL", b"GA", b"GB"))
+
+def nmea_checksum_ok(line: bytes):
+    """Validate the XOR checksum between '$' and '*' against the hex tail."""
+    star = line.rfind(b"*")
+    if star < 0 or star + 3 > len(line):
+        return False
+    try:
+        want = int(line[star + 1:star + 3], 16)
+    except ValueError:
+        return False
+    # reduce(xor) folds the payload in one C-level pass over a zero-copy
+    # memoryview instead of a Python byte loop over a fresh slice.
+    return reduce(xor, memoryview(line)[1:star], 0) == want
+
+def handle_line(line, state, _get_handler=HANDLERS.get):
+    """Dispatch one NMEA sentence (bytes) into state; ignore unknown lines."""
+    if len(line) < 7 or line[0] != 0x24:  # "$"
+        return
+    state["had_nmea"] = True
+    if line[1:3] not in TALKERS:
+        return
+    h = _get_handler(line[3:6])
+    if h is None:
+        return
+    # Gate corrupted sentences (common on the noisy soft-UART path) with
+    # ~30 cheap byte ops before paying for the field split.
+    if not nmea_checksum_ok(line):
+        return
+    # The handlers only read p[1]..p[9], so stop splitting after the 10th
+    # comma: RMC's magvar/mode tail and GGA's geoid/DGPS tail stay as one
+    # unsplit remainder instead of five more throwaway slices.
+    p = line.split(b",", 10)
+    if len(p) >= 10:
+        h(p, state)
+
+# CSV field -> (state key, value when missing, formatter). Testing the
+# value against None (rather than `v or default`) keeps legitimate zeros:
+# lat/lon 0.0 on the equator/meridian and sats 0 were all previously
+# collapsed to the empty default by truthiness.
+ROW_SPEC = (
+    ("lat", "lat", "", truncate),
+    ("lon", "lon", "", truncate),
+    ("alt_m", "alt", "", truncate),
+    ("sats", "sats", "", None),
+    ("hdop", "hdop", "", lambda v: truncate(v, 2)),
+    ("speed_kmh", "speed_kmh", "", lambda v: truncate(v, 3)),
+    ("course_deg", "course_deg", "", lambda v: truncate(v, 1)),
+    ("fix_quality", "fixq", 0, None),
+    ("raw_date_utc", "r_date", "", None),
+    ("raw_time_utc", "r_time", "", None),
+)
+
+def state_to_row(state):
     # Timestamp
-    if gps_dt and fix_status == "fix":
-        ts = gps_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+    if state["gps_dt"] and state["fix_status"] == "fix":
+        ts = state["gps_dt"].strftime("%Y-%m-%dT%H:%M:%SZ")
         status = "fix"
-    elif datetime.now(timezone.utc).year > 2020:
+    elif time.gmtime().tm_year > 2020:
         ts = safe_now_utc_str()
-        status = "system_time_no_fix" if had_nmea else "system_time_no_nmea"
+        status = "system_time_no_fix" if state["had_nmea"] else "system_time_no_nmea"
     else:
         ts = ""
         status = "no_time"
 
-    row = {
-        "timestamp_utc": ts,
-        "lat": truncate(lat),
-        "lon": truncate(lon),
-        "alt_m": truncate(alt),
-        "sats": sats or "",
-        "hdop": truncate(hdop, 2),
-        "speed_kmh": truncate(speed_kmh, 3),
-        "course_deg": truncate(course_deg, 1),
-        "fix_quality": fixq or 0,
-        "raw_date_utc": r_date,
-        "raw_time_utc": r_time,
-        "status": status,
-    }
+    row = {"timestamp_utc": ts}
+    for name, key, default, fmt in ROW_SPEC:
+        v = state[key]
+        row[name] = default if v is None else (fmt(v) if fmt else v)
+    row["status"] = status
     return row
 
 # ============================================================
 # (6) Main
 # ============================================================
-def main():
-    os.makedirs(DATA_DIR, exist_ok=True)
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    csv_path = os.path.join(DATA_DIR, f"{today}_gps.csv")
-    write_header = not os.path.exists(csv_path)
+def take_snapshot():
+    """Read the GPS once; return (row, json_record, console message)."""
+    # Read, parsing incrementally so the window ends as soon as we hold a
+    # complete fix (active RMC + the GGA that pairs with it) instead of
+    # burning the full READ_WINDOW_S on every hot start.
+    state = new_parse_state()
+
+    def _on_line(line):
+        handle_line(line, state)
+        return fix_complete(state)
 
-    # Read
     if MODE == "soft":
-        nmea_lines, err = read_nmea_lines_soft(BAUD, READ_WINDOW_S, SOFT_RX_PIN)
-        source_note = f"softGPIO{SOFT_RX_PIN}"
+        _, err = read_nmea_lines_soft(BAUD, READ_WINDOW_S, SOFT_RX_PIN,
+                                      on_line=_on_line, collect=False)
     else:
-        nmea_lines, err = read_nmea_lines_hard(GPS_PORT, BAUD, READ_WINDOW_S)
-        source_note = GPS_PORT
+        _, err = read_nmea_lines_hard(GPS_PORT, BAUD, READ_WINDOW_S,
+                                      on_line=_on_line, collect=False)
 
-    # Error
     if err:
-        ts = safe_now_utc_str()
         row = {k: "" for k in CSV_FIELDS}
-        row.update({"timestamp_utc": ts, "fix_quality": 0, "status": err})
-        write_row(csv_path, write_header, row)
-        json_path = os.path.join(DATA_DIR, "JSON_export_prototype.txt")
+        row.update({"timestamp_utc": safe_now_utc_str(),
+                    "fix_quality": 0, "status": err})
         json_record = {
             "turtle_id": "HT-0001",
             "device_id": "pi-zero-2",
-            "source": source_note,
+            "source": SOURCE_NOTE,
             "fix": row
         }
-        with open(json_path, "a") as jf:
-            jf.write(json.dumps(json_record) + "\n")
-        print(f"[WARN] GPS read failed ({err}) via {source_note} -> CSV+JSON saved")
-        return 0
-
-    # Parse
-    row = parse_nmea_to_row(nmea_lines)
-    write_row(csv_path, write_header, row)
+        msg = f"[WARN] GPS read failed ({err}) via {SOURCE_NOTE} -> CSV+JSON saved"
+        return row, json_record, msg
 
-    # JSON
-    json_path = os.path.join(DATA_DIR, "JSON_export_prototype.txt")
+    # Parse (already accumulated incrementally during the read)
+    row = state_to_row(state)
     json_record = {
         "turtle_id": "HT-0001",
         "device_id": "pi-zero-2",
-        "source": source_note,
+        "source": SOURCE_NOTE,
         "sats": row.get("sats", ""),
         "fix": row
     }
-    with open(json_path, "a") as jf:
-        jf.write(json.dumps(json_record) + "\n")
-
-    # Console
     ts = row["timestamp_utc"] or "(NO_TIME)"
     if row["status"] == "fix":
-        print(f"Logged FIX: {ts} lat={row['lat']} lon={row['lon']} sats={row['sats']} -> CSV+JSON saved (GPS:{source_note})")
+        msg = (f"Logged FIX: {ts} lat={row['lat']} lon={row['lon']} "
+               f"sats={row['sats']} -> CSV+JSON saved (GPS:{SOURCE_NOTE})")
     else:
-        print(f"Logged {row['status'].upper()}: {ts} -> CSV+JSON saved (GPS:{source_note})")
+        msg = f"Logged {row['status'].upper()}: {ts} -> CSV+JSON saved (GPS:{SOURCE_NOTE})"
+    return row, json_record, msg
+
+class LogBatcher:
+    """Buffers formatted CSV/JSON lines and appends each batch in one write.
+
+    Keeps both fds open across fixes (the CSV reopens only on UTC day
+    rollover, flushing first so a batch never spans files). batch_rows=1
+    keeps the write-per-fix behavior; larger values trade a power-cut
+    window of up to batch_rows fixes for N-times fewer SD-card flushes.
+    """
+
+    def __init__(self, data_dir, batch_rows=1):
+        self.data_dir = data_dir
+        self.batch_rows = max(1, batch_rows)
+        self.csv_buf = []
+        self.json_buf = []
+        self.csv_fd = None
+        self.csv_day = None
+        json_path = os.path.join(data_dir, "JSON_export_prototype.txt")
+        self.json_fd = os.open(json_path,
+                               os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+    def add(self, row, json_line):
+        """Queue one fix: row is the field dict, json_line is preformatted
+        bytes so the caller can share one serialisation with publish_latest."""
+        day = today_utc_str()
+        if day != self.csv_day:
+            self.flush()
+            if self.csv_fd is not None:
+                os.close(self.csv_fd)
+            csv_path = os.path.join(self.data_dir, f"{day}_gps.csv")
+            self.csv_fd = os.open(csv_path,
+                                  os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            if os.fstat(self.csv_fd).st_size == 0:
+                os.write(self.csv_fd, CSV_HEADER)
+            self.csv_day = day
+        self.csv_buf.append(format_row(row))
+        self.json_buf.append(json_line)
+        if len(self.csv_buf) >= self.batch_rows:
+            self.flush()
+
+    def flush(self):
+        if self.csv_buf:
+            os.write(self.csv_fd, b"".join(self.csv_buf))
+            self.csv_buf.clear()
+        if self.json_buf:
+            os.write(self.json_fd, b"".join(self.json_buf))
+            self.json_buf.clear()
+
+    def close(self):
+        self.flush()
+        if self.csv_fd is not None:
+            os.close(self.csv_fd)
+            self.csv_fd = None
+        if self.json_fd is not None:
+            os.close(self.json_fd)
+            self.json_fd = None
+
+def publish_latest(json_line):
+    """Atomically replace DATA_DIR/latest_fix.json with the newest record.
+
+    Takes the already-formatted line bytes (shared with the JSONL sink).
+    Write-to-temp + rename means readers (OLED scripts, a future
+    uploader) always see a complete record and never need to open the
+    UART or scan the CSVs themselves.
+    """
+    latest = os.path.join(DATA_DIR, "latest_fix.json")
+    tmp = latest + ".tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, json_line)
+    finally:
+        os.close(fd)
+    os.replace(tmp, latest)
+
+def run_daemon(interval_s):
+    """Stay resident and log every interval_s seconds through a LogBatcher."""
+    import atexit, signal
+
+    sink = LogBatcher(DATA_DIR, BATCH_ROWS)
+    atexit.register(sink.close)
+    # systemd stops us with SIGTERM; route it through SystemExit so the
+    # atexit flush runs and no buffered rows are lost.
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    while True:
+        t_next = time.monotonic() + interval_s
+        row, json_record, msg = take_snapshot()
+        # Serialise the record once; the JSONL sink and latest_fix.json
+        # both get the same bytes.
+        json_line = format_json_record(json_record)
+        sink.add(row, json_line)
+        publish_latest(json_line)
+        print(msg)
+        delay = t_next - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+def main():
+    os.makedirs(DATA_DIR, exist_ok=True)
+
+    if DAEMON_INTERVAL_S > 0:
+        run_daemon(DAEMON_INTERVAL_S)
+        return 0
+
+    today = today_utc_str()
+    csv_path = os.path.join(DATA_DIR, f"{today}_gps.csv")
 
+    row, json_record, msg = take_snapshot()
+    write_row(csv_path, row)
+    write_json_record(os.path.join(DATA_DIR, "JSON_export_prototype.txt"),
+                      json_record)
+    print(msg)
     return 0
 
 # ============================================================
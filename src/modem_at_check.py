@@ -5,21 +5,44 @@ import serial
 MODEM_PORT = os.getenv("HT_MODEM_PORT", "/dev/serial0")  # full UART on pins 8/10
 BAUD = int(os.getenv("HT_MODEM_BAUD", "9600"))
 
-def at(ser, cmd, wait=0.3):
+def at(ser, cmd, deadline_s=2.0):
+    """Send one AT command and read until the modem says OK or ERROR.
+
+    A healthy SIM900 answers most of these in a few ms, so returning as
+    soon as the terminator arrives (instead of sleeping a fixed 0.3 s
+    per command) cuts the whole check from ~3 s of sleep to round-trip
+    time. ser.timeout bounds each read; deadline_s bounds the command
+    overall in case the modem streams unsolicited output.
+    """
     ser.reset_input_buffer()
     ser.write((cmd + "\r").encode())
-    time.sleep(wait)
-    out = ser.read_all().decode(errors="ignore")
+    buf = b""
+    end = time.monotonic() + deadline_s
+    while b"OK" not in buf and b"ERROR" not in buf:
+        chunk = ser.read(ser.in_waiting or 1)
+        if not chunk or time.monotonic() > end:
+            break
+        buf += chunk
+    out = buf.decode(errors="ignore")
     print(f">>> {cmd}\n{out.strip()}\n")
     return out
 
 def main():
     try:
-        ser = serial.Serial(MODEM_PORT, BAUD, timeout=1)
+        # timeout is the per-read ceiling inside at(); 0.5 s is plenty
+        # for the inter-byte gaps of a responding modem.
+        ser = serial.Serial(MODEM_PORT, BAUD, timeout=0.5)
     except Exception as e:
         print(f"[ERR] open {MODEM_PORT}: {e}")
         return 1
 
+    try:
+        # ASYNC_LOW_LATENCY (TIOCSSERIAL): deliver bytes as they arrive
+        # instead of letting USB-UART bridges batch them for ~16 ms.
+        ser.set_low_latency_mode(True)
+    except Exception:
+        pass  # non-Linux, pty, or driver without serial_struct support
+
     at(ser, "AT")
     at(ser, "ATE0")            # echo off
     at(ser, "AT+CPIN?")        # SIM ready?
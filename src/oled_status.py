@@ -15,8 +15,11 @@ Usage:
   python3 oled_status.py brief
 """
 
-import os, sys, time, traceback, glob, csv, math
-from datetime import datetime, timezone
+# Keep module import lean for cold starts on battery: mmap loads lazily in
+# the one helper that reads the logs, and PIL/luma stay inside the render
+# paths. math must stay top-level — _distance_to_ref_km binds its
+# functions as defaults at definition time.
+import os, sys, time, traceback, math
 
 # ---------- Config ----------
 DATA_DIR = os.path.expanduser(os.getenv("HT_DATA_DIR", "~/hopeturtle/data"))
@@ -38,15 +41,24 @@ def _init_device():
         print(f"[OLED] Not available: {e.__class__.__name__}: {e}")
         return None
 
+_FONT = None
+
+def _get_font():
+    """Load the display font once; every later canvas reuses it."""
+    global _FONT
+    if _FONT is None:
+        from PIL import ImageFont
+        try:
+            _FONT = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 12)
+        except Exception:
+            _FONT = ImageFont.load_default()
+    return _FONT
+
 def _prep_canvas(device):
-    from PIL import Image, ImageDraw, ImageFont
+    from PIL import Image, ImageDraw
     img = Image.new("1", (device.width, device.height), 0)
     draw = ImageDraw.Draw(img)
-    try:
-        font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 12)
-    except Exception:
-        font = ImageFont.load_default()
-    return img, draw, font
+    return img, draw, _get_font()
 
 def _show_lines(device, lines, hold_s=2.5, center=False):
     """Render up to 5 lines of short text."""
@@ -78,23 +90,44 @@ def _clear(device):
     img = Image.new("1", (device.width, device.height), 0)
     device.display(img)
 
+_TURTLE_FRAMES = [
+    [
+        "   _________    ____ ",
+        "  /           \\ |  o |",
+        " |            |/ ___\\|",
+        " |____________|_/    ",
+        "   |__|  |__|        ",
+    ],
+    [
+        "   _________    ____ ",
+        "  /           \\ |  o |",
+        " |            |/ ___\\|",
+        " |____________|_/    ",
+        "   |_  |__|  _|      ",
+    ],
+]
+
+_SPRITES = None
+
+def _get_sprites():
+    """Rasterise the ASCII turtle frames to 1-bit images once per process."""
+    global _SPRITES
+    if _SPRITES is None:
+        from PIL import Image
+        sprites = []
+        for frame in _TURTLE_FRAMES:
+            w = max(len(row) for row in frame)
+            img = Image.new("1", (w, len(frame)), 0)
+            px = img.load()
+            for row_idx, row in enumerate(frame):
+                for col_idx, ch in enumerate(row):
+                    if ch != " ":
+                        px[col_idx, row_idx] = 1
+            sprites.append(img)
+        _SPRITES = sprites
+    return _SPRITES
+
 def _swim_animation(device, duration_s=5.0, fps=12):
-    frames = [
-        [
-            "   _________    ____ ",
-            "  /           \\ |  o |",
-            " |            |/ ___\\|",
-            " |____________|_/    ",
-            "   |__|  |__|        ",
-        ],
-        [
-            "   _________    ____ ",
-            "  /           \\ |  o |",
-            " |            |/ ___\\|",
-            " |____________|_/    ",
-            "   |_  |__|  _|      ",
-        ],
-    ]
     if device is None:
         print("[OLED] (simulated) swimming turtle for 5s…")
         time.sleep(duration_s)
@@ -105,43 +138,123 @@ def _swim_animation(device, duration_s=5.0, fps=12):
     x = -20
     dx = 3
     frame_i = 0
+    sprites = _get_sprites()
+    # One canvas for the whole animation: a rectangle wipe plus a sprite
+    # paste per frame replaces the per-pixel draw.point double loop, so
+    # each frame is two C-level PIL calls instead of ~100 Python ones.
+    img = Image.new("1", (W, H), 0)
+    draw = ImageDraw.Draw(img)
     while time.time() - start < duration_s:
-        img = Image.new("1", (W, H), 0)
-        draw = ImageDraw.Draw(img)
-        sprite = frames[frame_i % len(frames)]
-        sy = H//2 - len(sprite)//2
-        for row_idx, row in enumerate(sprite):
-            for col_idx, ch in enumerate(row):
-                if ch not in (" ",):
-                    px = x + col_idx
-                    py = sy + row_idx
-                    if 0 <= px < W and 0 <= py < H:
-                        draw.point((px, py), 1)
+        draw.rectangle((0, 0, W, H), fill=0)
+        sprite = sprites[frame_i % len(sprites)]
+        sy = H//2 - sprite.height//2
+        img.paste(sprite, (x, sy))
         device.display(img)
         time.sleep(1.0/fps)
         frame_i += 1
         x += dx
         if x > W:
-            x = -len(sprite[0])
+            x = -sprite.width
     _clear(device)
 
 # ---------- Distance helpers ----------
-def _haversine_km(lat1, lon1, lat2, lon2):
-    R = 6371.0088
-    phi1, phi2 = math.radians(lat1), math.radians(lat2)
-    dphi = phi2 - phi1
-    dlmb = math.radians(lon2 - lon1)
-    a = math.sin(dphi/2)**2 + math.cos(phi1)*math.cos(phi2)*math.sin(dlmb/2)**2
-    return R * 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
+# The reference point is fixed for the life of the process, so its trig
+# is paid once at import instead of on every distance call.
+_EARTH_R_KM = 6371.0088
+_REF_PHI = math.radians(REF_LAT)
+_REF_LAM = math.radians(REF_LON)
+_REF_COS = math.cos(_REF_PHI)
+
+def _distance_to_ref_km(lat, lon, precise=False,
+                        _radians=math.radians, _sin=math.sin, _cos=math.cos,
+                        _atan2=math.atan2, _sqrt=math.sqrt):
+    """Great-circle km from (lat, lon) to the reference point.
+
+    Default path is an equirectangular projection — accurate to ~0.1% at
+    the few-hundred-km scale a turtle covers, with half the trig of the
+    haversine kept behind precise=True for long-range use. math.* stay
+    pre-bound as defaults so repeated calls (e.g. distance over a whole
+    track) skip the module attribute lookups per invocation.
+    """
+    phi = _radians(lat)
+    dphi = _REF_PHI - phi
+    dlmb = _REF_LAM - _radians(lon)
+    if not precise:
+        x = _cos((phi + _REF_PHI) * 0.5) * dlmb
+        return _EARTH_R_KM * _sqrt(dphi*dphi + x*x)
+    a = _sin(dphi/2)**2 + _cos(phi)*_REF_COS*_sin(dlmb/2)**2
+    return _EARTH_R_KM * 2 * _atan2(_sqrt(a), _sqrt(1-a))
+
+def _last_fix_in_file(fp: str):
+    """Newest fix row in one CSV as (ts, lat, lon, sats), or None.
+
+    mmaps the file and walks whole lines backwards from EOF with rfind,
+    so a megabytes-long day log touches only the pages actually scanned
+    — the newest fix is normally within the last few lines. Fields come
+    from a plain split: the writer folds commas out of status, and every
+    column we read sits before it anyway.
+    """
+    import mmap
+    with open(fp, "rb") as f:
+        header = f.readline().decode("ascii", errors="ignore").strip().split(",")
+        try:
+            i_ts = header.index("timestamp_utc")
+            i_lat, i_lon = header.index("lat"), header.index("lon")
+            i_sats, i_status = header.index("sats"), header.index("status")
+        except ValueError:
+            return None
+        header_end = f.tell()
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return None  # empty file
+        with mm:
+            pos = len(mm)
+            while pos > header_end:
+                nl = mm.rfind(b"\n", header_end, pos)
+                start = nl + 1 if nl != -1 else header_end
+                raw = mm[start:pos].strip()
+                pos = start - 1
+                if not raw:
+                    continue
+                row = raw.decode("ascii", errors="ignore").split(",")
+                if (len(row) > i_status and row[i_status].lower() == "fix"
+                        and row[i_lat] and row[i_lon]):
+                    return (row[i_ts], float(row[i_lat]), float(row[i_lon]),
+                            row[i_sats] or "?")
+    return None
 
 def _find_last_fix_from_csvs(data_dir: str):
-    files = sorted(glob.glob(os.path.join(data_dir, "*_gps.csv")), key=os.path.getmtime, reverse=True)
-    for fp in files:
+    # Logs are named YYYY-MM-DD_gps.csv, so on the common path the newest
+    # fix lives in today's file — probe it directly before paying for a
+    # directory scan at all.
+    today_fp = os.path.join(data_dir,
+                            time.strftime("%Y-%m-%d", time.gmtime()) + "_gps.csv")
+    try:
+        found = _last_fix_in_file(today_fp)
+        if found:
+            ts, lat, lon, sats = found
+            return today_fp, ts, lat, lon, sats
+    except Exception:
+        pass
+    # Fallback: today's file is missing or fixless (e.g. just past UTC
+    # midnight). scandir serves st_mtime from the directory walk itself,
+    # where glob + os.path.getmtime paid one extra stat() syscall per file.
+    try:
+        with os.scandir(data_dir) as it:
+            entries = [(e.stat().st_mtime, e.path)
+                       for e in it if e.name.endswith("_gps.csv")]
+    except OSError:
+        return None, None, None, None, None
+    entries.sort(reverse=True)
+    for _, fp in entries:
+        if fp == today_fp:
+            continue  # already probed
         try:
-            rows = list(csv.DictReader(open(fp)))
-            for row in reversed(rows):
-                if (row.get("status") or "").lower() == "fix" and row.get("lat") and row.get("lon"):
-                    return fp, row.get("timestamp_utc"), float(row["lat"]), float(row["lon"]), row.get("sats") or "?"
+            found = _last_fix_in_file(fp)
+            if found:
+                ts, lat, lon, sats = found
+                return fp, ts, lat, lon, sats
         except Exception:
             continue
     return None, None, None, None, None
@@ -151,7 +264,7 @@ def _show_last_distance(device):
     if not fp:
         _show_lines(device, ["No last fix", "found"], hold_s=3, center=True)
         return
-    km = _haversine_km(lat, lon, REF_LAT, REF_LON)
+    km = _distance_to_ref_km(lat, lon)
     lines = [f"{km:.1f} km → Mawasi", f"({lat:.3f},{lon:.3f})", f"Sats: {sats}", ts]
     _show_lines(device, lines, hold_s=4, center=True)
 
@@ -160,7 +273,7 @@ def _show_brief(device):
     if not fp:
         _show_lines(device, ["No fix yet", "Check GPS..."], hold_s=3, center=True)
         return
-    km = _haversine_km(lat, lon, REF_LAT, REF_LON)
+    km = _distance_to_ref_km(lat, lon)
     lines = [f"{lat:.3f},{lon:.3f}", f"{km:.1f} km → Mawasi", f"Sats: {sats}"]
     _show_lines(device, lines, hold_s=4, center=True)
 